@@ -11,6 +11,7 @@ class ClipTask:
     startTimeSeconds: float
     durationSeconds: float
     outputPath: str
+    eventSeconds: float
 
 
 class ClipExtractionWorker(QObject):
@@ -56,7 +57,14 @@ class ClipExtractionWorker(QObject):
             seconds = int(absoluteSecond % 60)
             outputFilename = f"{eventType}-{minutes}m{seconds}s.mp4"
             outputPath = os.path.join(self.outputDir, outputFilename)
-            tasks.append(ClipTask(startTimeSeconds=startTime, durationSeconds=duration, outputPath=outputPath))
+            tasks.append(
+                ClipTask(
+                    startTimeSeconds=startTime,
+                    durationSeconds=duration,
+                    outputPath=outputPath,
+                    eventSeconds=absoluteSecond,
+                )
+            )
         return tasks
 
     def run(self) -> None:
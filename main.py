@@ -1,9 +1,10 @@
 import os
 import sys
-from typing import List
+from collections import OrderedDict
+from typing import Dict, List
 
-from PyQt6.QtCore import QThread, Qt, QUrl
-from PyQt6.QtGui import QDesktopServices, QFont
+from PyQt6.QtCore import QEvent, QModelIndex, QPoint, QSize, QThread, Qt, QUrl
+from PyQt6.QtGui import QDesktopServices, QFont, QIcon, QPixmap
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PyQt6.QtMultimediaWidgets import QVideoWidget
 from PyQt6.QtWidgets import (
@@ -27,9 +28,59 @@ from PyQt6.QtWidgets import (
     QSpacerItem,
     QSlider,
     QSplitter,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionSlider,
+    QStyleOptionViewItem,
 )
 
 from clip_worker import ClipExtractionWorker
+from thumbnail_worker import PosterSheetWorker, ThumbnailStrip, ThumbnailStripWorker
+
+
+class PosterItemDelegate(QStyledItemDelegate):
+    """Draws clip list rows with a poster taken from the session's sprite sheet.
+
+    Posters are only decoded for rows Qt actually paints, and a small LRU of pixmaps
+    keeps memory bounded no matter how long the list is.
+    """
+
+    def __init__(self, parent, posterSize: QSize, cacheLimit: int = 200) -> None:
+        super().__init__(parent)
+        self.posterSize = posterSize
+        self.cacheLimit = cacheLimit
+        self.sheet: ThumbnailStrip | None = None
+        self.pixmapCache: OrderedDict[int, QPixmap] = OrderedDict()
+
+    def setSheet(self, sheet: ThumbnailStrip | None) -> None:
+        self.sheet = sheet
+        self.pixmapCache.clear()
+
+    def posterForRow(self, row: int) -> QPixmap | None:
+        pixmap = self.pixmapCache.get(row)
+        if pixmap is not None:
+            self.pixmapCache.move_to_end(row)
+            return pixmap
+        if self.sheet is None or row >= self.sheet.frameCount:
+            return None
+        pixmap = self.sheet.pixmapAt(row)
+        self.pixmapCache[row] = pixmap
+        if len(self.pixmapCache) > self.cacheLimit:
+            self.pixmapCache.popitem(last=False)
+        return pixmap
+
+    def initStyleOption(self, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        super().initStyleOption(option, index)
+        pixmap = self.posterForRow(index.row())
+        if pixmap is not None:
+            option.features |= QStyleOptionViewItem.ViewItemFeature.HasDecoration
+            option.icon = QIcon(pixmap)
+            option.decorationSize = self.posterSize
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        # Reserve poster height up front so rows do not jump when the sheet arrives
+        size = super().sizeHint(option, index)
+        return QSize(size.width(), max(size.height(), self.posterSize.height() + 6))
 
 
 class MainWindow(QMainWindow):
@@ -50,6 +101,18 @@ class MainWindow(QMainWindow):
         self.player: QMediaPlayer | None = None
         self.audioOutput: QAudioOutput | None = None
         self.videoWidget: QVideoWidget | None = None
+        # Poster sheet and hover strip workers run one after the other on a low-priority thread
+        self.backgroundThread: QThread | None = None
+        self.backgroundWorker: ThumbnailStripWorker | PosterSheetWorker | None = None
+        # Clip path -> thumbnail frame file; only the playing clip's file is kept memory-mapped
+        self.thumbnailPaths: Dict[str, str] = {}
+        self.thumbnailStrip: ThumbnailStrip | None = None
+        # Bumped whenever background workers are stopped; their late signals are then ignored
+        self.backgroundGeneration: int = 0
+        self.currentClipPath: str = ""
+        # Poster sprite sheet for the clip list; frame i is the poster of row i
+        self.posterTimestamps: List[float] = []
+        self.posterSheet: ThumbnailStrip | None = None
 
         self.setWindowTitle("Valorant VOD Clip Extractor")
         self.resize(980, 680)
@@ -139,16 +202,20 @@ class MainWindow(QMainWindow):
         # Group 5: Generated clips list (interactive)
         clipsGroup = QGroupBox("Generated Clips")
         clipsGroup.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
-        clipsGroup.setMaximumHeight(150)
+        clipsGroup.setMaximumHeight(300)
         clipsLayout = QVBoxLayout()
         clipsLayout.setSpacing(8)
         clipsGroup.setLayout(clipsLayout)
         self.clipsListWidget = QListWidget()
         self.clipsListWidget.setAlternatingRowColors(True)
         self.clipsListWidget.setUniformItemSizes(True)
+        # Where to adjust clip list poster size (display size, sheet resolution is in PosterSheetWorker)
+        self.posterDelegate = PosterItemDelegate(self.clipsListWidget, QSize(96, 54))
+        self.clipsListWidget.setItemDelegate(self.posterDelegate)
+        self.clipsListWidget.setIconSize(QSize(96, 54))
         # Keep this section compact; user can scroll
         self.clipsListWidget.setMinimumHeight(70)
-        self.clipsListWidget.setMaximumHeight(110)
+        self.clipsListWidget.setMaximumHeight(260)
         self.clipsListWidget.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.clipsListWidget.customContextMenuRequested.connect(self.onClipsContextMenu)
         # Double-click to play inside the in-app viewer
@@ -190,6 +257,12 @@ class MainWindow(QMainWindow):
         self.positionSlider.setRange(0, 0)
         # Where to adjust seek behavior: slider moves the playback position in ms
         self.positionSlider.sliderMoved.connect(self.onSeek)
+        # Hover previews: track the mouse over the slider and show the nearest thumbnail
+        self.positionSlider.setMouseTracking(True)
+        self.positionSlider.installEventFilter(self)
+        self.seekPreviewLabel = QLabel(self, Qt.WindowType.ToolTip)
+        self.seekPreviewLabel.setObjectName("seekPreview")
+        self.seekPreviewLabel.hide()
         self.timeLabel = QLabel("00:00 / 00:00")
         controlsRow.addWidget(self.playPauseButton)
         controlsRow.addWidget(self.stopButton)
@@ -268,6 +341,13 @@ class MainWindow(QMainWindow):
         os.makedirs(outputDir, exist_ok=True)
         self.currentOutputDir = outputDir
 
+        # Clips are about to be overwritten: stop pending previews and release mapped files
+        self.stopBackgroundWorker()
+        self.closeThumbnailStrip()
+        self.thumbnailPaths.clear()
+        self.currentClipPath = ""
+        self.closePosterSheet()
+
         self.clipsListWidget.clear()
         self.setUiBusy(True)
         self.statusLabel.setText("Generating clips...")
@@ -286,6 +366,8 @@ class MainWindow(QMainWindow):
             preSeconds=preSeconds,
             postSeconds=postSeconds,
         )
+        # Posters are grabbed at each event's moment, in the same order clips are listed
+        self.posterTimestamps = [task.eventSeconds for task in self.worker.buildTasks()]
 
         self.worker.moveToThread(self.workerThread)
         self.workerThread.started.connect(self.worker.run)
@@ -330,6 +412,174 @@ class MainWindow(QMainWindow):
         self.setUiBusy(False)
         # Refresh nav buttons in case more clips were added
         self.updateNavButtons()
+        # Thumbnails are generated only after extraction so they never compete with it, and
+        # only one background FFmpeg runs at a time: posters first (visible without playing
+        # anything), then the hover strips once the poster worker finishes
+        self.startPosterWorker()
+
+    # --- Seek-bar hover thumbnails ---
+    def startThumbnailWorker(self) -> None:
+        clipPaths: List[str] = []
+        for row in range(self.clipsListWidget.count()):
+            data = self.clipsListWidget.item(row).data(Qt.ItemDataRole.UserRole)
+            if isinstance(data, dict) and data.get("path"):
+                clipPaths.append(data["path"])
+        if not clipPaths or not self.currentOutputDir:
+            return
+
+        worker = ThumbnailStripWorker(
+            clipPaths=clipPaths,
+            outputDir=os.path.join(self.currentOutputDir, "thumbs"),
+        )
+        # The playing clip's strip is built first so its hover previews work soonest
+        worker.prioritize(self.currentClipPath)
+        worker.stripReady.connect(self.currentGenerationOnly(self.onThumbnailStripReady))
+        self.startBackgroundWorker(worker)
+
+    def startBackgroundWorker(self, worker: ThumbnailStripWorker | PosterSheetWorker, onFinished=None) -> None:
+        # Thumbnail workers run one at a time, on a thread kept (with its FFmpeg child) below the UI
+        self.backgroundThread = QThread(self)
+        self.backgroundWorker = worker
+        worker.moveToThread(self.backgroundThread)
+        self.backgroundThread.started.connect(worker.run)
+        worker.errorOccurred.connect(self.currentGenerationOnly(self.onThumbnailError))
+        worker.finished.connect(self.currentGenerationOnly(self.onBackgroundWorkerFinished))
+        if onFinished is not None:
+            worker.finished.connect(self.currentGenerationOnly(onFinished))
+        worker.finished.connect(self.backgroundThread.quit)
+        worker.finished.connect(worker.deleteLater)
+        self.backgroundThread.finished.connect(self.backgroundThread.deleteLater)
+        self.backgroundThread.start(QThread.Priority.LowPriority)
+
+    def stopBackgroundWorker(self) -> None:
+        self.backgroundGeneration += 1
+        if self.backgroundWorker:
+            # Plain Python call: safe even if the worker's Qt object was already deleted
+            self.backgroundWorker.cancel()
+            self.backgroundWorker = None
+        self.waitForThread(self.backgroundThread)
+        self.backgroundThread = None
+
+    def onBackgroundWorkerFinished(self) -> None:
+        self.backgroundWorker = None
+        self.backgroundThread = None
+
+    def currentGenerationOnly(self, slot):
+        # Signals a stopped worker queued before it was joined still arrive afterwards;
+        # drop them instead of disconnecting a worker that may already be deleted
+        generation = self.backgroundGeneration
+
+        def guardedSlot(*args) -> None:
+            if generation == self.backgroundGeneration:
+                slot(*args)
+
+        return guardedSlot
+
+    def waitForThread(self, thread: QThread | None) -> None:
+        # The worker's finished->quit hop is queued to this (blocked) thread, so quit directly
+        if thread is not None:
+            thread.quit()
+            thread.wait()
+
+    def onThumbnailStripReady(self, clipPath: str, stripPath: str) -> None:
+        self.thumbnailPaths[clipPath] = stripPath
+
+    def onThumbnailError(self, message: str) -> None:
+        # Previews are optional; report without interrupting the reviewer
+        self.statusLabel.setText(f"Thumbnail error: {message}")
+
+    def closeThumbnailStrip(self) -> None:
+        self.seekPreviewLabel.hide()
+        if self.thumbnailStrip:
+            self.thumbnailStrip.close()
+            self.thumbnailStrip = None
+
+    def currentThumbnailStrip(self) -> ThumbnailStrip | None:
+        stripPath = self.thumbnailPaths.get(self.currentClipPath, "")
+        if not stripPath:
+            return None
+        if self.thumbnailStrip is None or self.thumbnailStrip.path != stripPath:
+            self.closeThumbnailStrip()
+            try:
+                self.thumbnailStrip = ThumbnailStrip(stripPath)
+            except (OSError, RuntimeError):
+                return None
+        return self.thumbnailStrip if self.thumbnailStrip.frameCount > 0 else None
+
+    def sliderValueAt(self, x: int) -> int:
+        # Map a mouse x coordinate to a slider value the same way the style does for clicks
+        option = QStyleOptionSlider()
+        self.positionSlider.initStyleOption(option)
+        style = self.positionSlider.style()
+        groove = style.subControlRect(
+            QStyle.ComplexControl.CC_Slider, option, QStyle.SubControl.SC_SliderGroove, self.positionSlider
+        )
+        handle = style.subControlRect(
+            QStyle.ComplexControl.CC_Slider, option, QStyle.SubControl.SC_SliderHandle, self.positionSlider
+        )
+        span = max(1, groove.width() - handle.width())
+        offset = x - groove.x() - handle.width() // 2
+        return QStyle.sliderValueFromPosition(
+            self.positionSlider.minimum(), self.positionSlider.maximum(), offset, span, option.upsideDown
+        )
+
+    def showSeekPreview(self, x: int) -> None:
+        strip = self.currentThumbnailStrip()
+        if strip is None or self.positionSlider.maximum() <= 0:
+            self.seekPreviewLabel.hide()
+            return
+        self.seekPreviewLabel.setPixmap(strip.pixmapAt(strip.indexAt(self.sliderValueAt(x))))
+        self.seekPreviewLabel.adjustSize()
+        anchor = self.positionSlider.mapToGlobal(QPoint(x, 0))
+        self.seekPreviewLabel.move(
+            anchor.x() - self.seekPreviewLabel.width() // 2,
+            anchor.y() - self.seekPreviewLabel.height() - 6,
+        )
+        self.seekPreviewLabel.show()
+
+    def eventFilter(self, watched, event) -> bool:
+        if watched is self.positionSlider:
+            if event.type() == QEvent.Type.MouseMove:
+                self.showSeekPreview(int(event.position().x()))
+            elif event.type() == QEvent.Type.Leave:
+                self.seekPreviewLabel.hide()
+        return super().eventFilter(watched, event)
+
+    # --- End seek-bar hover thumbnails ---
+
+    # --- Clip list posters ---
+    def startPosterWorker(self) -> None:
+        if not self.posterTimestamps or not self.currentOutputDir or self.clipsListWidget.count() == 0:
+            self.startThumbnailWorker()
+            return
+
+        worker = PosterSheetWorker(
+            vodPath=self.vodFilePath,
+            timestamps=self.posterTimestamps,
+            outputDir=os.path.join(self.currentOutputDir, "thumbs"),
+        )
+        worker.sheetReady.connect(self.currentGenerationOnly(self.onPosterSheetReady))
+        # Hover strips follow once the sheet is done
+        self.startBackgroundWorker(worker, onFinished=self.startThumbnailWorker)
+
+    def onPosterSheetReady(self, sheetPath: str) -> None:
+        self.closePosterSheet()
+        try:
+            self.posterSheet = ThumbnailStrip(sheetPath)
+        except (OSError, RuntimeError) as exc:
+            self.onThumbnailError(str(exc))
+            return
+        self.posterDelegate.setSheet(self.posterSheet)
+        # Only visible rows repaint, so only their posters get decoded
+        self.clipsListWidget.viewport().update()
+
+    def closePosterSheet(self) -> None:
+        self.posterDelegate.setSheet(None)
+        if self.posterSheet:
+            self.posterSheet.close()
+            self.posterSheet = None
+
+    # --- End clip list posters ---
 
     # --- Viewer and list interactions ---
     def onPlaySelectedClip(self) -> None:
@@ -368,6 +618,12 @@ class MainWindow(QMainWindow):
         # Highlight current clip in list
         self.clipsListWidget.setCurrentRow(index)
         self.currentClipIndex = index
+        if fullPath != self.currentClipPath:
+            # Release the previous clip's mapped strip and move this clip's strip to the front
+            self.closeThumbnailStrip()
+            if isinstance(self.backgroundWorker, ThumbnailStripWorker):
+                self.backgroundWorker.prioritize(fullPath)
+        self.currentClipPath = fullPath
         self.updateNavButtons()
         self.updateMetadata(os.path.basename(fullPath), start)
         # Ensure focus on viewer so keyboard space toggles play/pause
@@ -425,6 +681,11 @@ class MainWindow(QMainWindow):
                 font-weight: 600;
             }
             QPushButton { padding: 6px 12px; }
+            QLabel#seekPreview {
+                border: 1px solid palette(mid);
+                background: palette(Base);
+                padding: 2px;
+            }
             QListWidget {
                 border: 1px solid palette(mid);
                 background: palette(Base);
@@ -548,6 +809,14 @@ class MainWindow(QMainWindow):
 
     # --- End player controls ---
 
+    def closeEvent(self, event) -> None:
+        # Background thumbnails may still be running: kill FFmpeg and join the threads
+        # so Qt never destroys a running QThread and no orphaned FFmpeg keeps writing
+        self.stopBackgroundWorker()
+        self.closePosterSheet()
+        self.closeThumbnailStrip()
+        super().closeEvent(event)
+
 
 def main() -> None:
     app = QApplication(sys.argv)
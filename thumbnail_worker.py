@@ -0,0 +1,397 @@
+import hashlib
+import mmap
+import os
+import struct
+import subprocess
+import sys
+import threading
+from typing import List
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap
+
+
+# Layout of a thumbnail frame file: a fixed header followed by tightly packed RGB24
+# frames of identical size, so any frame can be sliced straight out of a memory map.
+FRAME_FILE_MAGIC = b"VTHM"
+FRAME_FILE_HEADER = struct.Struct("<4sHHI")  # magic, width, height, intervalMs
+FRAME_FILE_SUFFIX = ".thumbs"
+POSTER_SHEET_PREFIX = "posters-"
+
+
+def startLowPriorityProcess(cmd: List[str], stdout) -> subprocess.Popen:
+    # Where to adjust background FFmpeg priority: keep it below clip extraction and playback.
+    # On POSIX the priority is lowered after launch; preexec_fn is unsafe while Qt threads run.
+    try:
+        if sys.platform == "win32":
+            return subprocess.Popen(cmd, stdout=stdout, creationflags=subprocess.BELOW_NORMAL_PRIORITY_CLASS)
+        process = subprocess.Popen(cmd, stdout=stdout)
+    except FileNotFoundError as fnf_err:
+        raise RuntimeError(
+            "FFmpeg not found. Please install FFmpeg and ensure it is in your PATH."
+        ) from fnf_err
+    try:
+        os.setpriority(os.PRIO_PROCESS, process.pid, 10)
+    except OSError:
+        pass  # Already exited; nothing left to deprioritize
+    return process
+
+
+class ThumbnailCancelled(Exception):
+    """Raised inside a worker when its FFmpeg work was cancelled."""
+
+
+class FfmpegRunner:
+    """Runs background FFmpeg commands one at a time; cancel() may be called from any thread."""
+
+    def __init__(self) -> None:
+        self.cancelled = False
+        self.process: subprocess.Popen | None = None
+        self.lock = threading.Lock()
+
+    def cancel(self) -> None:
+        with self.lock:
+            self.cancelled = True
+            if self.process is not None:
+                self.process.kill()
+
+    def run(self, cmd: List[str], stdout) -> None:
+        with self.lock:
+            # Checked before every launch, so a cancelled worker never starts another FFmpeg pass
+            if self.cancelled:
+                raise ThumbnailCancelled()
+            self.process = startLowPriorityProcess(cmd, stdout)
+        returnCode = self.process.wait()
+        with self.lock:
+            self.process = None
+            if self.cancelled:
+                raise ThumbnailCancelled()
+        if returnCode != 0:
+            raise subprocess.CalledProcessError(returnCode, cmd)
+
+
+def writeFrameFile(
+    runner: FfmpegRunner,
+    cmds: List[List[str]],
+    outputPath: str,
+    width: int,
+    height: int,
+    intervalMs: int,
+    framesPerCommand: List[int] | None = None,
+) -> None:
+    # FFmpeg streams raw frames to stdout, which is the frame file positioned right
+    # after the header; each command appends where the previous one stopped.
+    # Write to a temp file first so readers never map a partial file.
+    # With framesPerCommand, a failed command only blanks its own frames; the file
+    # is given up only when every command failed.
+    tempPath = outputPath + ".part"
+    try:
+        with open(tempPath, "wb") as frameFile:
+            frameFile.write(FRAME_FILE_HEADER.pack(FRAME_FILE_MAGIC, width, height, intervalMs))
+            frameFile.flush()
+            lastFailure: subprocess.CalledProcessError | None = None
+            failedCommands = 0
+            for i, cmd in enumerate(cmds):
+                commandStart = frameFile.seek(0, os.SEEK_END)
+                try:
+                    runner.run(cmd, frameFile)
+                except subprocess.CalledProcessError as cpe:
+                    if framesPerCommand is None:
+                        raise
+                    lastFailure = cpe
+                    failedCommands += 1
+                    # Frames from a failed run cannot be trusted to line up; blank the whole command
+                    frameFile.truncate(commandStart)
+                if framesPerCommand is not None:
+                    padFrames(frameFile, commandStart, framesPerCommand[i], width * height * 3)
+            if lastFailure is not None and failedCommands == len(cmds):
+                raise lastFailure
+        os.replace(tempPath, outputPath)
+    except subprocess.CalledProcessError as cpe:
+        raise RuntimeError(f"FFmpeg failed for thumbnails of {os.path.basename(outputPath)}") from cpe
+    finally:
+        if os.path.exists(tempPath):
+            os.remove(tempPath)
+
+
+def padFrames(frameFile, commandStart: int, expectedFrames: int, frameBytes: int) -> None:
+    # A command that came up short (e.g. a timestamp past the end of the VOD) is padded
+    # with blank frames, so frames written by later commands keep their indices
+    written = frameFile.seek(0, os.SEEK_END) - commandStart
+    completeFrames = min(written // frameBytes, expectedFrames)
+    frameFile.truncate(commandStart + completeFrames * frameBytes)
+    frameFile.seek(0, os.SEEK_END)
+    frameFile.write(bytes(frameBytes) * (expectedFrames - completeFrames))
+    frameFile.flush()
+
+
+class ThumbnailStrip:
+    """Read-only memory-mapped view over a thumbnail frame file."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.file = open(path, "rb")
+        try:
+            if os.fstat(self.file.fileno()).st_size < FRAME_FILE_HEADER.size:
+                raise RuntimeError(f"Truncated thumbnail file: {os.path.basename(path)}")
+            self.buffer = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self.file.close()
+            raise
+        magic, self.width, self.height, self.intervalMs = FRAME_FILE_HEADER.unpack_from(self.buffer, 0)
+        if magic != FRAME_FILE_MAGIC:
+            self.close()
+            raise RuntimeError(f"Not a thumbnail file: {os.path.basename(path)}")
+        self.frameBytes = self.width * self.height * 3
+        self.frameCount = (len(self.buffer) - FRAME_FILE_HEADER.size) // self.frameBytes
+
+    def frameAt(self, index: int) -> bytes:
+        if index < 0 or index >= self.frameCount:
+            raise IndexError(index)
+        offset = FRAME_FILE_HEADER.size + index * self.frameBytes
+        return self.buffer[offset:offset + self.frameBytes]
+
+    def indexAt(self, positionMs: int) -> int:
+        # Frames are sampled every intervalMs starting at 0, so the nearest one is a rounding away
+        index = int(round(max(0, positionMs) / max(1, self.intervalMs)))
+        return min(index, self.frameCount - 1)
+
+    def pixmapAt(self, index: int) -> QPixmap:
+        image = QImage(self.frameAt(index), self.width, self.height, self.width * 3, QImage.Format.Format_RGB888)
+        # Copy so the pixmap does not reference the transient bytes object
+        return QPixmap.fromImage(image.copy())
+
+    def close(self) -> None:
+        buffer = getattr(self, "buffer", None)
+        if buffer is not None:
+            buffer.close()
+        self.file.close()
+
+
+class ThumbnailStripWorker(QObject):
+    # Signals to communicate with the GUI thread
+    stripReady = pyqtSignal(str, str)
+    errorOccurred = pyqtSignal(str)
+    finished = pyqtSignal()
+
+    def __init__(
+        self,
+        clipPaths: List[str],
+        outputDir: str,
+        width: int = 160,
+        height: int = 90,
+        intervalMs: int = 250,
+    ) -> None:
+        super().__init__()
+        # Clips still waiting for a strip; the GUI thread may reorder them via prioritize()
+        self.pendingClipPaths = list(clipPaths)
+        self.pendingLock = threading.Lock()
+        self.outputDir = outputDir
+        # Where to adjust hover preview resolution and sampling rate
+        self.width = width
+        self.height = height
+        self.intervalMs = intervalMs
+        self.ffmpeg = FfmpegRunner()
+
+    def cancel(self) -> None:
+        # Kills the FFmpeg pass in flight and stops before the next clip
+        self.ffmpeg.cancel()
+
+    def prioritize(self, clipPath: str) -> None:
+        # Called from the GUI thread when the reviewer switches clips: that strip goes next
+        with self.pendingLock:
+            if clipPath in self.pendingClipPaths:
+                self.pendingClipPaths.remove(clipPath)
+                self.pendingClipPaths.insert(0, clipPath)
+
+    def nextClipPath(self) -> str | None:
+        with self.pendingLock:
+            return self.pendingClipPaths.pop(0) if self.pendingClipPaths else None
+
+    def stripPathFor(self, clipPath: str) -> str:
+        return os.path.join(self.outputDir, os.path.basename(clipPath) + FRAME_FILE_SUFFIX)
+
+    def removeStaleStrips(self, clipsDir: str) -> None:
+        # Strips of clips that no longer exist would otherwise pile up in the thumbs folder
+        for name in os.listdir(self.outputDir):
+            if not name.endswith(FRAME_FILE_SUFFIX) or name.startswith(POSTER_SHEET_PREFIX):
+                continue
+            if not os.path.exists(os.path.join(clipsDir, name[: -len(FRAME_FILE_SUFFIX)])):
+                try:
+                    os.remove(os.path.join(self.outputDir, name))
+                except OSError:
+                    pass  # Still in use; retried on the next run
+
+    def run(self) -> None:
+        try:
+            os.makedirs(self.outputDir, exist_ok=True)
+            with self.pendingLock:
+                clipsDirs = {os.path.dirname(clipPath) for clipPath in self.pendingClipPaths}
+            for clipsDir in clipsDirs:
+                self.removeStaleStrips(clipsDir)
+            while not self.ffmpeg.cancelled:
+                clipPath = self.nextClipPath()
+                if clipPath is None:
+                    break
+                stripPath = self.stripPathFor(clipPath)
+                self.executeFfmpeg(clipPath, stripPath)
+                # Emit the clip and the frame file that now backs its hover previews
+                self.stripReady.emit(clipPath, stripPath)
+        except ThumbnailCancelled:
+            pass
+        except Exception as exc:  # noqa: BLE001 - surface any unexpected errors
+            self.errorOccurred.emit(str(exc))
+        finally:
+            self.finished.emit()
+
+    def executeFfmpeg(self, clipPath: str, stripPath: str) -> None:
+        # How FFmpeg is called to extract a thumbnail strip in a single pass:
+        # sample at a fixed rate, letterbox to a fixed size and dump raw RGB24 frames
+        frameRate = 1000.0 / self.intervalMs
+        videoFilter = (
+            f"fps={frameRate},"
+            f"scale={self.width}:{self.height}:force_original_aspect_ratio=decrease,"
+            f"pad={self.width}:{self.height}:(ow-iw)/2:(oh-ih)/2"
+        )
+        cmd = [
+            "ffmpeg",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-i",
+            clipPath,
+            "-an",
+            "-vf",
+            videoFilter,
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "rgb24",
+            "pipe:1",
+        ]
+        writeFrameFile(self.ffmpeg, [cmd], stripPath, self.width, self.height, self.intervalMs)
+
+
+class PosterSheetWorker(QObject):
+    # Signals to communicate with the GUI thread
+    sheetReady = pyqtSignal(str)
+    errorOccurred = pyqtSignal(str)
+    finished = pyqtSignal()
+
+    def __init__(
+        self,
+        vodPath: str,
+        timestamps: List[float],
+        outputDir: str,
+        width: int = 96,
+        height: int = 54,
+        batchSize: int = 32,
+    ) -> None:
+        super().__init__()
+        self.vodPath = vodPath
+        # One poster per clip, in clip list order: frame i of the sheet belongs to row i
+        self.timestamps = timestamps
+        self.outputDir = outputDir
+        # Where to adjust clip list poster size and how many posters one FFmpeg run decodes
+        self.width = width
+        self.height = height
+        self.batchSize = batchSize
+        self.ffmpeg = FfmpegRunner()
+
+    def cancel(self) -> None:
+        # Kills the FFmpeg run in flight and skips the remaining batches; the .part sheet is discarded
+        self.ffmpeg.cancel()
+
+    def sheetPath(self) -> str:
+        # How the sheet is cached per session: keyed by VOD identity, timestamps and poster size,
+        # so reopening the same VOD with the same events reuses it without running FFmpeg
+        stat = os.stat(self.vodPath)
+        key = repr(
+            (
+                os.path.abspath(self.vodPath),
+                stat.st_size,
+                stat.st_mtime_ns,
+                [round(t, 3) for t in self.timestamps],
+                self.width,
+                self.height,
+            )
+        )
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.outputDir, f"{POSTER_SHEET_PREFIX}{digest}{FRAME_FILE_SUFFIX}")
+
+    def removeStaleSheets(self, sheetPath: str) -> None:
+        # Only the current session's sheet is kept; older VOD/event combinations are dropped
+        for name in os.listdir(self.outputDir):
+            path = os.path.join(self.outputDir, name)
+            if name.startswith(POSTER_SHEET_PREFIX) and name.endswith(FRAME_FILE_SUFFIX) and path != sheetPath:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass  # Still in use; retried on the next run
+
+    def run(self) -> None:
+        try:
+            if not self.timestamps or self.ffmpeg.cancelled:
+                return
+            os.makedirs(self.outputDir, exist_ok=True)
+            sheetPath = self.sheetPath()
+            if not os.path.isfile(sheetPath):
+                self.executeFfmpeg(sheetPath)
+            self.removeStaleSheets(sheetPath)
+            self.sheetReady.emit(sheetPath)
+        except ThumbnailCancelled:
+            pass
+        except Exception as exc:  # noqa: BLE001 - surface any unexpected errors
+            self.errorOccurred.emit(str(exc))
+        finally:
+            self.finished.emit()
+
+    def buildBatchCommand(self, timestamps: List[float]) -> List[str]:
+        # How FFmpeg is called to grab many posters in one run: every timestamp becomes an
+        # input that seeks straight to it, each input contributes its first frame, and
+        # the frames are concatenated into a single raw RGB24 stream.
+        # Each poster is overlaid on a one-frame blank background, so an input with no
+        # frame (timestamp past the end of the VOD) still yields exactly one frame and
+        # the posters after it stay aligned with their rows. The background also fixes the
+        # output at one frame per second, so no frame-rate option is needed (works on FFmpeg 4.x).
+        cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error"]
+        for timestamp in timestamps:
+            cmd += ["-ss", f"{max(timestamp, 0.0):.3f}", "-t", "1", "-i", self.vodPath]
+        filters = []
+        for i in range(len(timestamps)):
+            filters += [
+                f"color=c=black:s={self.width}x{self.height}:r=1:d=1,setsar=1[bg{i}]",
+                f"[{i}:v]trim=end_frame=1,setpts=PTS-STARTPTS,"
+                f"scale={self.width}:{self.height}:force_original_aspect_ratio=decrease,"
+                f"pad={self.width}:{self.height}:(ow-iw)/2:(oh-ih)/2,setsar=1[s{i}]",
+                f"[bg{i}][s{i}]overlay=eof_action=pass,trim=end_frame=1,setpts=PTS-STARTPTS[p{i}]",
+            ]
+        concatInputs = "".join(f"[p{i}]" for i in range(len(timestamps)))
+        filters.append(f"{concatInputs}concat=n={len(timestamps)}:v=1:a=0[posters]")
+        cmd += [
+            "-filter_complex",
+            ";".join(filters),
+            "-map",
+            "[posters]",
+            "-frames:v",
+            str(len(timestamps)),
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "rgb24",
+            "pipe:1",
+        ]
+        return cmd
+
+    def executeFfmpeg(self, sheetPath: str) -> None:
+        # Batches keep the command line within OS limits on long event lists
+        batches = [self.timestamps[i:i + self.batchSize] for i in range(0, len(self.timestamps), self.batchSize)]
+        writeFrameFile(
+            self.ffmpeg,
+            [self.buildBatchCommand(batch) for batch in batches],
+            sheetPath,
+            self.width,
+            self.height,
+            0,
+            framesPerCommand=[len(batch) for batch in batches],
+        )